@@ -17,12 +17,25 @@
 # along with Tungsten. If not, see <https://www.gnu.org/licenses/>.
 
 __all__ = [
+    "Localized",
+    "LayoutCache",
     "ButtonState",
     "Button",
     "ButtonGroup",
     "Option",
     "SelectMenu",
+    "OptionIndex",
+    "SearchableSelectMenu",
     "Components",
+    "ComponentsSnapshot",
+    "offload",
+    "ComponentsReport",
+    "ComponentsHandle",
+    "ComponentsSupervisor",
+    "EditPriority",
+    "EditOutbox",
+    "AdmissionLimit",
+    "AdmissionControl",
 ]
 
 from .tungsten import *
@@ -19,23 +19,151 @@
 from __future__ import annotations
 
 __all__ = [
+    "Localized",
+    "LayoutCache",
     "ButtonState",
     "Button",
     "ButtonGroup",
     "Option",
     "SelectMenu",
+    "OptionIndex",
+    "SearchableSelectMenu",
     "Components",
+    "ComponentsSnapshot",
+    "offload",
+    "ComponentsReport",
+    "ComponentsHandle",
+    "ComponentsSupervisor",
+    "EditPriority",
+    "EditOutbox",
+    "AdmissionLimit",
+    "AdmissionControl",
 ]
 
 import asyncio
+import bisect
+import collections
+import concurrent.futures
+import copy
+import dataclasses
 from dataclasses import dataclass, field
+import datetime
+import enum
+import functools
+import heapq
+import itertools
+import logging
+import re
+import sys
+import time
+import tracemalloc
+import types
 import typing as t
+import warnings
+import weakref
 
 import hikari
 
 if t.TYPE_CHECKING:
     import lightbulb
 
+_LOGGER = logging.getLogger("lightbulb.ext.tungsten")
+
+_PerBotT = t.TypeVar("_PerBotT")
+# Maps each bot to the per bot objects (supervisor, outbox...) created for it, by their class.
+# The objects only keep a weak reference to their bot, so both are dropped along with the bot.
+_per_bot: weakref.WeakKeyDictionary[
+    lightbulb.BotApp, t.Dict[type, t.Any]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_for_bot(cls: t.Type[_PerBotT], bot: lightbulb.BotApp) -> _PerBotT:
+    instances = _per_bot.setdefault(bot, {})
+    if (instance := instances.get(cls)) is None:
+        instance = instances[cls] = cls(bot)
+    return instance
+
+
+@dataclass(frozen=True)
+class Localized:
+    """
+    Dataclass that represents a text that has to be translated before being shown.
+
+    It can be used instead of a plain string for the labels of :obj:`Button`, :obj:`ButtonState` and :obj:`Option`,
+    the description of :obj:`Option` and the placeholder of :obj:`SelectMenu`.
+    The text is resolved against the locale of the interaction by the ``localizer`` of the :obj:`Components`.
+
+    Args:
+        key (:obj:`str`): The key to look up the translation with.
+        default (:obj:`str`): The text to show if there's no translation, the key is shown if this is :obj:`None`.
+    """
+
+    key: str
+    default: t.Optional[str] = None
+
+
+def _render_text(value: t.Any) -> str:
+    if isinstance(value, Localized):
+        return value.default if value.default is not None else value.key
+    return f"{value}"
+
+
+class LayoutCache(object):
+    """
+    A bounded least recently used cache of built components.
+
+    :obj:`Components` keep the components they build here, keyed by their class, the locale they were
+    built for and the state of every button and option. Building the same layout again for the same
+    locale then skips translating and building it.
+
+    The same action row builders are returned to every :obj:`Components` building that layout,
+    so they must not be modified.
+
+    Args:
+        maxsize (:obj:`int`): The maximum amount of layouts kept, the least recently used are dropped first.
+    """
+
+    __slots__ = ("maxsize", "_layouts", "hits", "misses")
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._layouts: collections.OrderedDict[
+            t.Hashable, t.List[hikari.api.ActionRowBuilder]
+        ] = collections.OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def get(
+        self, key: t.Hashable
+    ) -> t.Optional[t.List[hikari.api.ActionRowBuilder]]:
+        """
+        Returns the layout stored with the given key, or :obj:`None`.
+        The list is a copy, but the action row builders in it are shared and must not be modified.
+        """
+        layout = self._layouts.get(key)
+        if layout is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._layouts.move_to_end(key)
+        return list(layout)
+
+    def put(
+        self, key: t.Hashable, layout: t.List[hikari.api.ActionRowBuilder]
+    ) -> None:
+        """Stores a layout with the given key, dropping the least recently used one if the cache is full."""
+        self._layouts[key] = list(layout)
+        self._layouts.move_to_end(key)
+        while len(self._layouts) > self.maxsize:
+            self._layouts.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every stored layout."""
+        self._layouts.clear()
+
 
 @dataclass
 class ButtonState:
@@ -45,13 +173,13 @@ class ButtonState:
     by predefining states.
 
     Args:
-        label (:obj:`str` | :obj:`int`): The label of the button.
+        label (:obj:`str` | :obj:`int` | :obj:`Localized`): The label of the button.
         style (:obj:`int` | :obj:`hikari.ButtonStyle<hikari.messages.ButtonStyle>`): The type of style this button state uses.
         emoji (:obj:`hikari.Snowflakeish<hikari.snowflakes.Snowflake>` | :obj:`hikari.Emoji<hikari.emojis.Emoji>` | :obj:`str`): A emoji that is shown along with the label.
 
     """
 
-    label: t.Union[str, int, None] = None
+    label: t.Union[str, int, Localized, None] = None
     style: t.Union[int, hikari.ButtonStyle, None] = None
     emoji: t.Union[hikari.Snowflakeish, hikari.Emoji, str, None] = None
 
@@ -62,7 +190,7 @@ class Button:
     Dataclass that represents a Discord Button.
 
     Args:
-        label (:obj:`str` | :obj:`int`): The label of the button.
+        label (:obj:`str` | :obj:`int` | :obj:`Localized`): The label of the button.
         style (:obj:`int` | :obj:`hikari.ButtonStyle<hikari.messages.ButtonStyle>`): The type of style this button uses.
         emoji (:obj:`hikari.Snowflakeish<hikari.snowflakes.Snowflake>` | :obj:`hikari.Emoji<hikari.emojis.Emoji>` | :obj:`str`): A emoji that is shown along with the label.
         is_disabled (:obj:`bool`): Whether this button can be clicked or not.
@@ -71,7 +199,7 @@ class Button:
         button_states (Dict[:obj:`typing.Hashable`, :obj:`ButtonState`]): A dictionary mapping to :obj:`ButtonState` objects.
     """
 
-    label: t.Union[str, int, None] = None
+    label: t.Union[str, int, Localized, None] = None
     style: t.Union[int, hikari.ButtonStyle, None] = None
     emoji: t.Union[hikari.Snowflakeish, hikari.Emoji, str, None] = None
     is_disabled: bool = False
@@ -79,7 +207,7 @@ class Button:
     state: t.Optional[t.Hashable] = None
     button_states: t.Optional[t.Dict[t.Hashable, ButtonState]] = None
 
-    _label: t.Union[str, int, None] = field(init=False, repr=False)
+    _label: t.Union[str, int, Localized, None] = field(init=False, repr=False)
     _style: t.Union[int, hikari.ButtonStyle, None] = field(init=False, repr=False)
     _emoji: t.Union[hikari.Snowflakeish, hikari.Emoji, str, None] = field(
         init=False, repr=False
@@ -87,6 +215,12 @@ class Button:
     _x: int = field(init=False, repr=False)
     _y: int = field(init=False, repr=False)
 
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        # Attributes that were never set hold the property itself, which can't be pickled
+        return {
+            k: None if isinstance(v, property) else v for k, v in self.__dict__.items()
+        }
+
     @property
     def coordinates(self) -> t.Tuple[int, int]:
         return (self._x, self._y)
@@ -115,7 +249,7 @@ class Button:
         self._style = value
 
     @property
-    def label(self) -> t.Union[str, int, None]:
+    def label(self) -> t.Union[str, int, Localized, None]:
         if self.button_states:
             return getattr(self.button_states[self.state], "label", self._label)
         elif not isinstance(self._label, property):
@@ -124,7 +258,7 @@ class Button:
             return None
 
     @label.setter
-    def label(self, value: t.Union[str, int]) -> None:
+    def label(self, value: t.Union[str, int, Localized]) -> None:
         self._label = value
 
     @property
@@ -143,25 +277,117 @@ class Button:
 
 TButtonGroup = t.TypeVar("TButtonGroup", bound="ButtonGroup")
 
+_ROW_LENGTH = 5
+_ROW_COUNT = 5
+_ROW_MASK = (1 << _ROW_LENGTH) - 1
+_FULL_GRID = (1 << (_ROW_LENGTH * _ROW_COUNT)) - 1
+
+
+def _lowest_bit_index(bits: int) -> int:
+    return (bits & -bits).bit_length() - 1
+
 
 class ButtonGroup(object):
     """
-    A class designed to contain and modify a List[List[:obj:`Button`]].
+    A class designed to contain and modify a 5x5 grid of :obj:`Button`.
+
+    The buttons are stored in 25 fixed slots along with a bitmap of which slots are occupied,
+    so finding a free slot or accessing a button by its coordinates doesn't require scanning the rows.
+    Rows may have gaps, Discord will still show the buttons of a row next to each other.
 
     In order to use it, an instance of this class has to be manually
     added as an argument to the constructor of a :obj:`Components` instance.
 
     Args:
         button_rows(List[List[:obj:`Button`]]): The List[List[:obj:`Button`]] meant to be contained and modified.
+        compact (:obj:`bool`): Whether removing a button moves the buttons that follow it in the row to the left. Setting this to :obj:`False` leaves a gap instead.
     """
 
-    __slots__ = ("button_rows", "link_mapping")
+    __slots__ = ("_slots", "_occupancy", "compact_on_remove", "link_mapping")
 
     def __init__(
-        self: TButtonGroup, button_rows: t.Optional[t.List[t.List[Button]]] = None
+        self: TButtonGroup,
+        button_rows: t.Optional[t.List[t.List[Button]]] = None,
+        compact: bool = True,
     ):
-        self.button_rows = button_rows or [[], [], [], [], []]
+        self._slots: t.List[t.Optional[Button]] = [None] * (_ROW_LENGTH * _ROW_COUNT)
+        self._occupancy: int = 0
+        self.compact_on_remove = compact
         self.link_mapping: t.Dict = {}
+        self.button_rows = button_rows or []
+
+    @property
+    def button_rows(self: TButtonGroup) -> t.List[t.List[Button]]:
+        """
+        A List[List[:obj:`Button`]] view of the grid, always five rows long.
+        Gaps are skipped, so use :meth:`get_button` to access a button by its coordinates.
+        Modifying the returned lists doesn't modify the grid.
+        """
+        return [
+            [
+                button
+                for button in self._slots[y * _ROW_LENGTH : (y + 1) * _ROW_LENGTH]
+                if button is not None
+            ]
+            for y in range(_ROW_COUNT)
+        ]
+
+    @button_rows.setter
+    def button_rows(self: TButtonGroup, value: t.List[t.List[Button]]) -> None:
+        if len(value) > _ROW_COUNT or any(len(row) > _ROW_LENGTH for row in value):
+            raise ValueError(
+                f"A ButtonGroup can't have more than {_ROW_COUNT} rows of {_ROW_LENGTH} buttons"
+            )
+        self._slots = [None] * (_ROW_LENGTH * _ROW_COUNT)
+        self._occupancy = 0
+        for y, row in enumerate(value):
+            for x, button in enumerate(row):
+                self._set(x, y, button, True)
+
+    @property
+    def free_slots(self: TButtonGroup) -> int:
+        """The amount of buttons that can still be added."""
+        return _ROW_LENGTH * _ROW_COUNT - bin(self._occupancy).count("1")
+
+    @property
+    def is_full(self: TButtonGroup) -> bool:
+        """Whether every one of the 25 slots has a button."""
+        return self._occupancy == _FULL_GRID
+
+    def _set(
+        self: TButtonGroup,
+        x: int,
+        y: int,
+        button: t.Optional[Button],
+        update_coordinates: bool,
+    ) -> None:
+        index = y * _ROW_LENGTH + x
+        self._slots[index] = button
+        if button is None:
+            self._occupancy &= ~(1 << index)
+        else:
+            self._occupancy |= 1 << index
+            if update_coordinates:
+                button.coordinates = (x, y)
+
+    def _check_coordinates(self: TButtonGroup, x: int, y: int) -> None:
+        if not (0 <= x < _ROW_LENGTH and 0 <= y < _ROW_COUNT):
+            raise IndexError(f"Coordinates ({x}, {y}) are outside of the 5x5 grid")
+
+    def is_row_empty(self: TButtonGroup, y: int) -> bool:
+        """Whether the row at the given y coordinate has no buttons."""
+        return not (self._occupancy >> (y * _ROW_LENGTH)) & _ROW_MASK
+
+    def get_button(self: TButtonGroup, x: int, y: int) -> Button:
+        """
+        Returns the button at the given coordinates.
+        Raises :obj:`IndexError` if there's no button there.
+        """
+        self._check_coordinates(x, y)
+        button = self._slots[y * _ROW_LENGTH + x]
+        if button is None:
+            raise IndexError(f"There's no button at ({x}, {y})")
+        return button
 
     def add_button(
         self: TButtonGroup,
@@ -170,25 +396,23 @@ class ButtonGroup(object):
         update_coordinates: bool = True,
     ) -> TButtonGroup:
         """
-        Adds a button to the end of :attr:`button_rows`.
+        Adds a button to the first free slot of the row at the given y coordinate,
+        or to the first free slot of the grid if no y coordinate is given.
         Updating coordinates will set coordinates to the new button.
-        It will fail if there's 25 buttons in :attr:`button_rows` already.
+        Raises :obj:`ValueError` if the row, or the whole grid, is full already.
         Returns :obj:`self`, so chaining methods is possible.
         """
-        if y or y == 0:
-            if (x := len(self.button_rows[y])) < 5:
-                coordinates = (x, y)
-        else:
-            for y, row in enumerate(self.button_rows):
-                if (x := len(row)) < 5:
-                    coordinates = (x, y)
-                    break
-
-        if update_coordinates:
-            button.coordinates = coordinates
-
-        self.button_rows[coordinates[1]].append(button)
+        free = ~self._occupancy & _FULL_GRID
+        if y is not None:
+            self._check_coordinates(0, y)
+            free &= _ROW_MASK << (y * _ROW_LENGTH)
+        if not free:
+            raise ValueError(
+                "The ButtonGroup is full" if y is None else f"Row {y} is full"
+            )
 
+        y, x = divmod(_lowest_bit_index(free), _ROW_LENGTH)
+        self._set(x, y, button, update_coordinates)
         return self
 
     def overwrite_button(
@@ -199,40 +423,41 @@ class ButtonGroup(object):
         update_coordinates: bool = True,
     ) -> TButtonGroup:
         """
-        Overwrites a button at the given coordinates in :attr:`button_rows`.
+        Overwrites a button at the given coordinates, the slot can also be empty.
         Updating coordinates will set the given coordinates to the new button.
         Returns :obj:`self`, so chaining methods is possible.
         """
-        self.button_rows[y][x] = button
-        if update_coordinates:
-            self.button_rows[y][x].coordinates = (x, y)
+        self._check_coordinates(x, y)
+        self._set(x, y, button, update_coordinates)
         return self
 
     def edit_button(self: TButtonGroup, x: int, y: int, **kwargs) -> TButtonGroup:
         """
-        Edits a button at the given coordinates in :attr:`button_rows` with the given arguments.
+        Edits a button at the given coordinates with the given arguments.
         Returns :obj:`self`, so chaining methods is possible.
         """
-        button = self.button_rows[y][x]
+        button = self.get_button(x, y)
         for k, v in kwargs.items():
             setattr(button, k, v)
-        self.button_rows[y][x] = button
         return self
 
     def remove_button(
         self: TButtonGroup, x: int, y: int, update_coordinates: bool = True
     ) -> TButtonGroup:
         """
-        Removes a button at the given coordinates in :attr:`button_rows`.
-        Updating coordinates will substract 1 to the x coordinate of the buttons that follow the removed button in the row.
+        Removes a button at the given coordinates.
+        If the group was created with ``compact=True``, the buttons that follow the removed button
+        in the row are moved one slot to the left, otherwise a gap is left.
+        Updating coordinates will substract 1 to the x coordinate of the buttons that were moved.
         Returns :obj:`self`, so chaining methods is possible.
         """
-        if self.button_rows[y] and len(self.button_rows[y]) > 0:
-            del self.button_rows[y][x]
-            if update_coordinates:
-                for button in self.button_rows[y]:
-                    if button._x > x:
-                        button._x -= 1
+        self.get_button(x, y)
+        self._set(x, y, None, False)
+        if self.compact_on_remove:
+            for x2 in range(x + 1, _ROW_LENGTH):
+                button = self._slots[y * _ROW_LENGTH + x2]
+                self._set(x2 - 1, y, button, update_coordinates)
+            self._set(_ROW_LENGTH - 1, y, None, False)
         return self
 
     def insert_button(
@@ -243,17 +468,21 @@ class ButtonGroup(object):
         update_coordinates: bool = True,
     ) -> TButtonGroup:
         """
-        Inserts a button at the given coordinates in :attr:`button_rows`.
-        Updating coordinates will add 1 to the x coordinate of the buttons that follow the inserted button in the row.
-        WARNING: It will not work if the row is already full.
+        Inserts a button at the given coordinates.
+        The buttons that follow it in the row are moved one slot to the right, up to the first free slot.
+        Updating coordinates will add 1 to the x coordinate of the buttons that were moved.
+        Raises :obj:`ValueError` if there's no free slot at or after the given x coordinate in the row.
         Returns :obj:`self`, so chaining methods is possible.
         """
-        if len(self.button_rows[y]) < 5 and x < 5:
-            button.coordinates = (x, y)
-            self.button_rows[y].insert(x, button)
-            if update_coordinates:
-                for button in self.button_rows[y][x+1:]:
-                    button._x += 1
+        self._check_coordinates(x, y)
+        free = (~self._occupancy >> (y * _ROW_LENGTH)) & _ROW_MASK & (_ROW_MASK << x)
+        if not free:
+            raise ValueError(f"Row {y} has no free slot to insert a button at x={x}")
+
+        for x2 in range(_lowest_bit_index(free), x, -1):
+            moved = self._slots[y * _ROW_LENGTH + x2 - 1]
+            self._set(x2, y, moved, update_coordinates)
+        self._set(x, y, button, True)
         return self
 
     def switch_button_position(
@@ -265,38 +494,73 @@ class ButtonGroup(object):
         update_coordinates: bool = True,
     ) -> TButtonGroup:
         """
-        Switches two buttons positions at the given coordinates in :attr:`button_rows`.
+        Switches two buttons positions at the given coordinates, either slot can be empty.
         Updating coordinates will switch the buttons coordinates too.
         Returns :obj:`self`, so chaining methods is possible.
         """
-        button_one = self.button_rows[y][x]
-        button_two = self.button_rows[y2][x2]
-        self.overwrite_button(button_one, x2, y2, update_coordinates=update_coordinates)
-        self.overwrite_button(button_two, x, y, update_coordinates=update_coordinates)
+        self._check_coordinates(x, y)
+        self._check_coordinates(x2, y2)
+        button_one = self._slots[y * _ROW_LENGTH + x]
+        button_two = self._slots[y2 * _ROW_LENGTH + x2]
+        self._set(x2, y2, button_one, update_coordinates)
+        self._set(x, y, button_two, update_coordinates)
         return self
 
+    def compact(self: TButtonGroup, update_coordinates: bool = True) -> TButtonGroup:
+        """
+        Moves the buttons of every row to the left, removing the gaps between them.
+        Updating coordinates will set the new coordinates to the moved buttons.
+        Returns :obj:`self`, so chaining methods is possible.
+        """
+        for y, row in enumerate(self.button_rows):
+            for x in range(_ROW_LENGTH):
+                self._set(x, y, row[x] if x < len(row) else None, update_coordinates)
+        return self
+
+    def _layout_key(self: TButtonGroup) -> t.Tuple[t.Any, ...]:
+        return tuple(
+            (index, button.style, button.label, button.emoji, button.is_disabled, button.url)
+            for index, button in enumerate(self._slots)
+            if button is not None
+        )
+
+    def _update_layout(self: TButtonGroup) -> None:
+        # The coordinates and link mapping _build keeps up to date, also needed when a built layout is reused
+        for index, button in enumerate(self._slots):
+            if button is None:
+                continue
+            y, x = divmod(index, _ROW_LENGTH)
+            if not button.url:
+                button._x = x
+                button._y = y
+            else:
+                self.link_mapping[button.url] = (x, y)
+
     def _build(
-        self: TButtonGroup, ctx: lightbulb.context.Context
+        self: TButtonGroup,
+        ctx: lightbulb.context.Context,
+        render: t.Callable[[t.Any], str] = _render_text,
     ) -> t.List[hikari.api.ActionRowBuilder]:
+        self._update_layout()
         action_rows = []
-        for y, row in enumerate(self.button_rows):
-            if not row:
+        for y in range(_ROW_COUNT):
+            if self.is_row_empty(y):
                 continue
             action_row = ctx.app.rest.build_action_row()
-            for x, button in enumerate(row):
+            for x in range(_ROW_LENGTH):
+                button = self._slots[y * _ROW_LENGTH + x]
+                if button is None:
+                    continue
                 if not button.url:
-                    button._x = x
-                    button._y = y
                     button_component = action_row.add_button(
-                        button.style, f"{button._x},{button._y}"
-                    ).set_label(f"{button.label}")
+                        button.style, f"{x},{y}"
+                    ).set_label(render(button.label))
                 else:
                     # Running a button with links in it will make response return None
                     # IDK if this is my fault or hikari's fault
                     button_component = action_row.add_button(
                         hikari.ButtonStyle.LINK, button.url
-                    ).set_label(f"{button.label}")
-                    self.link_mapping[button.url] = (x, y)
+                    ).set_label(render(button.label))
 
                 if button.emoji:
                     button_component.set_emoji(button.emoji)
@@ -310,10 +574,10 @@ class ButtonGroup(object):
 
     def disable_all_buttons(self: TButtonGroup):
         """
-        Sets all buttons :attr:`is_disabled` attribute to True on :attr:`button_rows`.
+        Sets all buttons :attr:`is_disabled` attribute to True.
         """
-        for row in self.button_rows:
-            for button in row:
+        for button in self._slots:
+            if button is not None:
                 button.is_disabled = True
 
 
@@ -323,14 +587,14 @@ class Option:
     Dataclass that represents a Discord Option from a select menu.
 
     Args:
-        label (:obj:`str` | :obj:`int`): The label of the option.
-        description (:obj:`str`): The description of the button.
+        label (:obj:`str` | :obj:`int` | :obj:`Localized`): The label of the option.
+        description (:obj:`str` | :obj:`Localized`): The description of the option.
         emoji (:obj:`hikari.Snowflakeish<hikari.snowflakes.Snowflake>` | :obj:`hikari.Emoji<hikari.emojis.Emoji>` | :obj:`str`): A emoji that is shown along with the label.
         is_default (:obj:`bool`): Whether this option should be selected by default.
     """
 
-    label: t.Union[str, int]
-    description: str = " "
+    label: t.Union[str, int, Localized]
+    description: t.Union[str, Localized] = " "
     emoji: t.Union[hikari.Snowflakeish, hikari.Emoji, str, None] = None
     is_default: bool = False
     _index: t.Union[int, None] = field(init=False, repr=False)
@@ -349,7 +613,7 @@ class SelectMenu(object):
     The options will be displayed from bottom to top.
 
     Args:
-        placeholder (:obj:`str`): The placeholder of the select menu.
+        placeholder (:obj:`str` | :obj:`Localized`): The placeholder of the select menu.
         is_disabled (:obj:`bool`): Whether the select menu is disabled.
         min_chosen (:obj:`int`): The minimum amount of options which must be chosen for this menu.
         max_chosen (:obj:`int`): The maximum amount of options which can be chosen for this menu.
@@ -360,7 +624,7 @@ class SelectMenu(object):
 
     def __init__(
         self: TSelectMenu,
-        placeholder: str,
+        placeholder: t.Union[str, Localized],
         is_disabled: bool = False,
         min_chosen: int = 1,
         max_chosen: int = 1,
@@ -455,23 +719,42 @@ class SelectMenu(object):
         self.overwrite_option(option_two, index, update_indexes=update_indexes)
         return self
 
+    def _layout_key(self) -> t.Tuple[t.Any, ...]:
+        return (
+            self.custom_id,
+            self.placeholder,
+            self.min_chosen,
+            self.max_chosen,
+            self.is_disabled,
+            tuple(
+                (option.label, option.description, option.emoji, option.is_default)
+                for option in self.options
+            ),
+        )
+
+    def _update_layout(self) -> None:
+        # The indexes _build keeps up to date, also needed when a built layout is reused
+        for index, option in enumerate(self.options):
+            option._index = index
+
     def _build(
-        self, ctx: lightbulb.context.Context
+        self,
+        ctx: lightbulb.context.Context,
+        render: t.Callable[[t.Any], str] = _render_text,
     ) -> t.List[hikari.api.ActionRowBuilder]:
         action_row = ctx.app.rest.build_action_row()
         select_menu = action_row.add_select_menu(self.custom_id)
-        select_menu.set_placeholder(self.placeholder)
+        select_menu.set_placeholder(render(self.placeholder))
         select_menu.set_min_values(self.min_chosen)
         select_menu.set_max_values(self.max_chosen)
         select_menu.set_is_disabled(self.is_disabled)
 
-        for index, option in enumerate(self.options):
-            option._index = index
-
+        self._update_layout()
+        for option in self.options:
             option_builder = select_menu.add_option(
-                f"{option.label}", f"{option._index}"
+                render(option.label), f"{option._index}"
             )
-            option_builder.set_description(f"{option.description}")
+            option_builder.set_description(render(option.description))
             if option.emoji is not None:
                 option_builder.set_emoji(option.emoji)
             option_builder.set_is_default(option.is_default)
@@ -490,6 +773,379 @@ class SelectMenu(object):
         self.is_disabled = True
 
 
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class OptionIndex(object):
+    """
+    A prebuilt search index over a catalog of :obj:`Option`, meant to be used by :obj:`SearchableSelectMenu`.
+
+    Every word of every option's label, and every whole label, is kept in a sorted list, so counting and finding
+    the options that start with a given prefix is a binary search instead of a scan of the whole catalog.
+    When a prefix is so common that scanning the catalog in order finds the best matches sooner, the catalog is scanned instead,
+    so a search looks at roughly ``sqrt(limit * len(index))`` options at most for a single word.
+    Several words are matched by intersecting the sets of options matching each word.
+    The index is never modified after being built, build it once per catalog and share it
+    between every :obj:`Components` instance.
+
+    Args:
+        options (Iterable[:obj:`Option`]): The catalog of options to index.
+        key (Callable[[:obj:`Option`], :obj:`str`]): Returns the text an option is searched by, defaults to its label.
+    """
+
+    __slots__ = (
+        "options",
+        "_texts",
+        "_sorted_texts",
+        "_text_positions",
+        "_tokens",
+        "_positions",
+    )
+
+    def __init__(
+        self,
+        options: t.Iterable[Option],
+        key: t.Optional[t.Callable[[Option], str]] = None,
+    ) -> None:
+        self.options: t.Tuple[Option, ...] = tuple(options)
+        self._texts: t.List[str] = []
+        entries: t.List[t.Tuple[str, int]] = []
+        for position, option in enumerate(self.options):
+            text = (key(option) if key else _render_text(option.label)).casefold()
+            self._texts.append(text)
+            entries.extend(
+                (token, position) for token in set(_TOKEN_PATTERN.findall(text))
+            )
+        entries.sort()
+        self._tokens: t.List[str] = [token for token, _ in entries]
+        self._positions: t.List[int] = [position for _, position in entries]
+        texts = sorted((text, position) for position, text in enumerate(self._texts))
+        self._sorted_texts: t.List[str] = [text for text, _ in texts]
+        self._text_positions: t.List[int] = [position for _, position in texts]
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    @staticmethod
+    def _prefix_range(keys: t.List[str], prefix: str) -> t.Tuple[int, int]:
+        start = bisect.bisect_left(keys, prefix)
+        return start, bisect.bisect_left(keys, prefix + "\U0010ffff", start)
+
+    def _first_matches(
+        self,
+        limit: int,
+        candidates: t.List[int],
+        is_match: t.Callable[[int], bool],
+    ) -> t.List[int]:
+        # Scanning the catalog in order is expected to look at about limit * len / matches options,
+        # checking every candidate costs len(candidates), whichever is cheaper is used.
+        if candidates and limit * len(self.options) < len(candidates) ** 2:
+            found = []
+            for position in range(len(self.options)):
+                if position > 2 * len(candidates):
+                    break  # the estimate was off, e.g. for several words
+                if is_match(position):
+                    found.append(position)
+                    if len(found) == limit:
+                        return found
+            else:
+                return found
+
+        return heapq.nsmallest(limit, {position for position in candidates if is_match(position)})
+
+    def search(self, query: str, limit: int = 25) -> t.List[Option]:
+        """
+        Returns up to ``limit`` options where every word of the query is the start of a word of the option.
+        Options whose whole text starts with the query come first, the rest keep the catalog order.
+        An empty query returns the first options of the catalog.
+        """
+        query = query.casefold().strip()
+        words = _TOKEN_PATTERN.findall(query)
+        if not words:
+            return list(self.options[:limit])
+
+        start, end = self._prefix_range(self._sorted_texts, query)
+        best = self._first_matches(
+            limit,
+            self._text_positions[start:end],
+            lambda position: self._texts[position].startswith(query),
+        )
+
+        if len(best) < limit:
+            first = set(best)
+            ranges = [self._prefix_range(self._tokens, word) for word in words]
+            if len(ranges) == 1:
+                start, end = ranges[0]
+                # The scan in catalog order also visits options without the word, so it has to be checked
+                word = re.compile(r"(?<!\w)" + re.escape(words[0]))
+                best.extend(
+                    self._first_matches(
+                        limit - len(best),
+                        self._positions[start:end],
+                        lambda position: position not in first
+                        and word.search(self._texts[position]) is not None,
+                    )
+                )
+            else:
+                # Intersecting whole sets is cheaper than checking the words of each candidate one by one
+                ranges.sort(key=lambda bounds: bounds[1] - bounds[0])
+                positions = set(self._positions[slice(*ranges[0])])
+                for bounds in ranges[1:]:
+                    if not positions:
+                        break
+                    positions.intersection_update(self._positions[slice(*bounds)])
+                positions -= first
+                best.extend(sorted(positions)[: limit - len(best)])
+
+        return [self.options[position] for position in best]
+
+
+TSearchableSelectMenu = t.TypeVar("TSearchableSelectMenu", bound="SearchableSelectMenu")
+
+
+class SearchableSelectMenu(SelectMenu):
+    """
+    A :obj:`SelectMenu` that shows the best matches of a text filter over an :obj:`OptionIndex`,
+    making it possible to pick from catalogs larger than 25 options.
+
+    The shown :attr:`options` are copies of the ones in the catalog, so editing them doesn't affect
+    other :obj:`Components` sharing the same :obj:`OptionIndex`.
+
+    Discord doesn't allow select menus without options, so when nothing matches the filter a single
+    option labeled ``no_results`` is shown and the select menu is disabled until the next filter matches something.
+    :attr:`min_chosen` and :attr:`max_chosen` are also lowered to the amount of shown options when there are fewer of them.
+
+    Args:
+        placeholder (:obj:`str` | :obj:`Localized`): The placeholder of the select menu.
+        index (:obj:`OptionIndex`): The catalog to search.
+        query (:obj:`str`): The initial text filter.
+        is_disabled (:obj:`bool`): Whether the select menu is disabled.
+        min_chosen (:obj:`int`): The minimum amount of options which must be chosen for this menu.
+        max_chosen (:obj:`int`): The maximum amount of options which can be chosen for this menu.
+        custom_id (:obj:`str`): The custom ID of the select menu.
+        no_results (:obj:`str` | :obj:`Localized`): The label of the option shown when nothing matches the filter.
+    """
+
+    def __init__(
+        self: TSearchableSelectMenu,
+        placeholder: t.Union[str, Localized],
+        index: OptionIndex,
+        query: str = "",
+        is_disabled: bool = False,
+        min_chosen: int = 1,
+        max_chosen: int = 1,
+        custom_id: str = "select_menu",
+        no_results: t.Union[str, Localized] = "No results",
+    ):
+        self.has_results = True
+        self.no_results = no_results
+        super().__init__(
+            placeholder,
+            is_disabled=is_disabled,
+            min_chosen=min_chosen,
+            max_chosen=max_chosen,
+            custom_id=custom_id,
+        )
+        self.index = index
+        self.filter(query)
+
+    def filter(self: TSearchableSelectMenu, query: str) -> TSearchableSelectMenu:
+        """
+        Replaces :attr:`options` with the best 25 matches of the given text in the :attr:`index`.
+        You still have to build the components to update them.
+        Returns :obj:`self`, so chaining methods is possible.
+        """
+        self.query = query
+        self.options = [
+            dataclasses.replace(option) for option in self.index.search(query)
+        ]
+        self.has_results = bool(self.options)
+        if not self.has_results:
+            self.options = [Option(self.no_results)]
+        for index, option in enumerate(self.options):
+            option._index = index
+        return self
+
+    @property
+    def is_disabled(self) -> bool:
+        """Whether the select menu is disabled, it always is while nothing matches the filter."""
+        return self._is_disabled or not self.has_results
+
+    @is_disabled.setter
+    def is_disabled(self, value: bool) -> None:
+        self._is_disabled = value
+
+    @property
+    def min_chosen(self) -> int:
+        """The minimum amount of options which must be chosen, at most the amount of shown options."""
+        return min(self._min_chosen, len(self.options))
+
+    @min_chosen.setter
+    def min_chosen(self, value: int) -> None:
+        self._min_chosen = value
+
+    @property
+    def max_chosen(self) -> int:
+        """The maximum amount of options which can be chosen, at most the amount of shown options."""
+        return min(self._max_chosen, len(self.options))
+
+    @max_chosen.setter
+    def max_chosen(self, value: int) -> None:
+        self._max_chosen = value
+
+
+@dataclass
+class ComponentsSnapshot:
+    """
+    Dataclass that represents a copy of the state of a :obj:`Components`, made by :meth:`Components.snapshot`.
+
+    It can be pickled, so it can be sent to another process, and modifying it doesn't modify the :obj:`Components`.
+
+    Args:
+        buttons (Dict[Tuple[:obj:`int`, :obj:`int`], :obj:`Button`]): Copies of the buttons, mapped by their coordinates.
+        options (List[:obj:`Option`]): Copies of the options of the select menu.
+    """
+
+    buttons: t.Dict[t.Tuple[int, int], Button] = field(default_factory=dict)
+    options: t.List[Option] = field(default_factory=list)
+
+
+CallbackT = t.TypeVar("CallbackT", bound=t.Callable[..., t.Awaitable[None]])
+
+
+def offload(
+    pure: t.Callable[..., t.Any],
+    executor: t.Optional[concurrent.futures.Executor] = None,
+    rebuild: bool = False,
+) -> t.Callable[[CallbackT], CallbackT]:
+    """
+    Decorator that runs the CPU heavy part of a :meth:`button_callback<Components.button_callback>`
+    or :meth:`select_menu_callback<Components.select_menu_callback>` in an executor, so it doesn't block the event loop.
+
+    ``pure`` is called in the executor with a :obj:`ComponentsSnapshot` followed by copies of the callback arguments,
+    without the interaction. Its return value is then passed as the first argument of the decorated callback,
+    which runs on the event loop and applies the result.
+
+    Args:
+        pure (Callable[..., Any]): The function to run in the executor. It must be defined at module level if the executor is a :obj:`concurrent.futures.ProcessPoolExecutor`.
+        executor (:obj:`concurrent.futures.Executor`): The executor to use, defaults to the :attr:`executor<Components.executor>` of the :obj:`Components`.
+        rebuild (:obj:`bool`): Whether to edit the message with the rebuilt components after the decorated callback is run.
+            Leave it disabled if the decorated callback edits the message itself, and pass ``components=self.build()`` in that edit instead.
+    """
+
+    def decorator(callback: CallbackT) -> CallbackT:
+        @functools.wraps(callback)
+        async def wrapper(self: Components, *args: t.Any) -> None:
+            *data, interaction = args
+            task = functools.partial(pure, self.snapshot(), *copy.deepcopy(data))
+            result = await asyncio.get_running_loop().run_in_executor(
+                executor or self.executor, task
+            )
+            await callback(self, result, *args)
+            if rebuild and not self._is_finished:
+                # The user is still waiting on the result of their click
+                await self.edit_msg(
+                    components=self.build(), priority=EditPriority.INTERACTIVE
+                )
+
+        return t.cast(CallbackT, wrapper)
+
+    return decorator
+
+
+class EditPriority(enum.IntEnum):
+    """The priority of a message edit in an :obj:`EditOutbox`, lower values are sent first."""
+
+    INTERACTIVE = 0
+    """A response to a user interacting with the components."""
+    REFRESH = 1
+    """An update of the components state that nobody is waiting for."""
+    CLEANUP = 2
+    """An edit done once the components are done, like the timeout message."""
+
+
+@dataclass
+class ComponentsReport:
+    """
+    Dataclass that represents the memory usage of the live :obj:`Components` instances,
+    returned by :meth:`Components.memory_report`.
+
+    Args:
+        live (:obj:`int`): The amount of :obj:`Components` instances that haven't been garbage collected.
+        running (:obj:`int`): How many of them are still waiting for interactions.
+        finished (:obj:`int`): How many of them are done, but are still referenced somewhere. A growing number usually means a leak.
+        age_histogram (Dict[:obj:`float`, :obj:`int`]): Maps the upper bound in seconds of each age bucket to the amount of instances in it, the last bucket is ``float("inf")``.
+        retained_bytes (:obj:`int`): Approximate amount of bytes held by the instances and their buttons and options, not counting the context and message.
+        snapshot (:obj:`tracemalloc.Snapshot`): A snapshot of the memory allocations, if one was requested while :mod:`tracemalloc` was tracing.
+    """
+
+    live: int
+    running: int
+    finished: int
+    age_histogram: t.Dict[float, int]
+    retained_bytes: int
+    snapshot: t.Optional[tracemalloc.Snapshot] = None
+
+
+def _is_for_message(
+    event: hikari.InteractionCreateEvent,
+    message_id: t.Optional[hikari.Snowflake],
+    interaction_id: t.Optional[hikari.Snowflake],
+) -> bool:
+    if not isinstance(event.interaction, hikari.ComponentInteraction):
+        return False
+    message = event.interaction.message
+    if message_id is not None:
+        return message.id == message_id
+    # Not bound yet, the message is the initial response to the command's interaction.
+    # Followups of the same interaction carry its id too, newer hikari versions tell them apart
+    # with the id of the original response in the interaction metadata.
+    metadata = getattr(message, "interaction_metadata", None)
+    if metadata is not None:
+        return (
+            metadata.interaction_id == interaction_id
+            and metadata.original_response_message_id is None
+        )
+    # Older hikari versions (the ones lightbulb 2.1 depends on) can't tell them apart, so only one
+    # unbound Components per command invocation is supported there.
+    interaction = getattr(message, "interaction", None)
+    return interaction is not None and interaction.id == interaction_id
+
+
+# Interaction tokens, and so the webhook used to edit or fetch the response, expire after 15 minutes.
+_INTERACTION_TOKEN_LIFETIME = 15 * 60
+# How long before the token expires the response message is fetched, so it can still be edited by id afterwards.
+_INTERACTION_TOKEN_MARGIN = 60
+
+
+def _interaction_token_time_left(
+    ctx: lightbulb.context.Context,
+) -> t.Optional[float]:
+    # Context.interaction is None for prefix contexts in lightbulb 2.x, their responses don't use a token
+    interaction = getattr(ctx, "interaction", None)
+    if interaction is None:
+        return None
+    age = datetime.datetime.now(datetime.timezone.utc) - interaction.created_at
+    return _INTERACTION_TOKEN_LIFETIME - age.total_seconds()
+
+
+class _ResponseTarget(object):
+    # Stands in for the message in the EditOutbox until it is known, editing it through
+    # the interaction's webhook, keyed by the interaction id. Webhook edits are rate limited
+    # per interaction token rather than per channel, so they get a bucket of their own.
+    __slots__ = ("response", "id", "rate_limit_bucket")
+
+    def __init__(
+        self, response: lightbulb.ResponseProxy, ctx: lightbulb.context.Context
+    ) -> None:
+        self.response = response
+        self.id = ctx.interaction.id
+        self.rate_limit_bucket = ("interaction", ctx.interaction.id)
+
+    async def edit(self, *args: t.Any, **kwargs: t.Any) -> hikari.Message:
+        return await self.response.edit(*args, **kwargs)
+
+
 class Components(object):
     """
     Base class for making a :obj:`Components` instance.
@@ -505,6 +1161,10 @@ class Components(object):
 
         - :meth:`clicks_until_deactivate_callback<Components.clicks_until_deactivate_callback>`
 
+        - :meth:`error_callback<Components.error_callback>`
+
+        - :meth:`rejected_callback<Components.rejected_callback>`
+
     The subclassed methods must have the same name and accept the same parameters.
 
     Args:
@@ -514,9 +1174,21 @@ class Components(object):
         clicks_until_deactivate (:obj:`int`): The number of times it can be clicked before calling :meth:`clicks_until_deactivate_callback<Components.clicks_until_deactivate_callback>`. Set this to 0, if you don't want a click limit.
         button_group(:obj:`ButtonGroup`): The :obj:`ButtonGroup` to use.
         select_menu(:obj:`SelectMenu`): The :obj:`SelectMenu` to use.
+        outbox(:obj:`EditOutbox`): The :obj:`EditOutbox` the message edits go through, defaults to the one shared by the bot.
+        admission(:obj:`AdmissionControl`): The :obj:`AdmissionControl` that decides whether the components can run, defaults to the one shared by the bot.
+        localizer(Callable[[:obj:`str`, Optional[:obj:`str`]], Optional[:obj:`str`]]): Called with the key of a :obj:`Localized` text and the locale of the interaction, it returns the translated text or :obj:`None` if there's no translation. Pass the same callable every time, so built components can be reused.
+        localizer_key(Hashable): Identifies the ``localizer`` in the :attr:`layout_cache` instead of the ``localizer`` itself. Required for built components to be cached when the ``localizer`` is a bound method, a closure or any other callable that isn't a plain function, since the cache would otherwise keep what it references alive.
+
+    Attributes:
+        layout_cache (Optional[:obj:`LayoutCache`]): The cache where built components are kept, shared by every instance. Set it to :obj:`None` in a subclass to always build the components.
+        executor (Optional[:obj:`concurrent.futures.Executor`]): The executor callbacks decorated with :func:`offload` run in, :obj:`None` uses the default executor of the event loop.
 
     """
 
+    layout_cache: t.Optional[LayoutCache] = LayoutCache()
+    executor: t.Optional[concurrent.futures.Executor] = None
+    _live: weakref.WeakSet[Components] = weakref.WeakSet()
+
     def __init__(
         self,
         ctx: lightbulb.context.Context,
@@ -525,6 +1197,12 @@ class Components(object):
         clicks_until_deactivate: int = 0,
         button_group: t.Optional[ButtonGroup] = None,
         select_menu: t.Optional[SelectMenu] = None,
+        localizer: t.Optional[
+            t.Callable[[str, t.Optional[str]], t.Optional[str]]
+        ] = None,
+        outbox: t.Optional[EditOutbox] = None,
+        admission: t.Optional[AdmissionControl] = None,
+        localizer_key: t.Optional[t.Hashable] = None,
     ):
 
         self.ctx = ctx
@@ -533,8 +1211,20 @@ class Components(object):
         self.clicks_until_deactivate = clicks_until_deactivate
         self.button_group = button_group
         self.select_menu = select_menu
+        self.localizer = localizer
+        self.localizer_key = localizer_key
+        self.outbox = outbox or EditOutbox.get(ctx.bot)
+        self.admission = admission or AdmissionControl.get(ctx.bot)
+        self.response: t.Optional[lightbulb.ResponseProxy] = None
+        self.message: t.Optional[hikari.Message] = None
         self._is_disabled: bool = False
         self._clicks: int = 0
+        self._created_at: float = time.monotonic()
+        self._last_interaction: float = self._created_at
+        self._is_finished: bool = False
+        self._is_evicted: bool = False
+        self._eviction: t.Optional[asyncio.Future[None]] = None
+        Components._live.add(self)
 
     async def button_callback(
         self, button: Button, x: int, y: int, interaction: hikari.ComponentInteraction
@@ -553,7 +1243,9 @@ class Components(object):
 
     async def timeout_callback(self) -> None:
         """This method is a default placeholder meant to be overwritten in a subclass. Though it can be left as is if you wish."""
-        await self.edit_msg("Interaction Timed Out.", components=[])
+        await self.edit_msg(
+            "Interaction Timed Out.", components=[], priority=EditPriority.CLEANUP
+        )
 
     async def not_allowed_id_callback(
         self, event: hikari.InteractionCreateEvent
@@ -568,7 +1260,34 @@ class Components(object):
     async def clicks_until_deactivate_callback(self) -> None:
         """This method is a default placeholder meant to be overwritten in a subclass. Though it can be left as is if you wish."""
         self.disable_components()
-        await self.edit_msg(content=self.message.content, components=self.build())
+        await self.edit_msg(
+            content=self.message.content,
+            components=self.build(),
+            priority=EditPriority.REFRESH,
+        )
+
+    async def rejected_callback(self, reason: AdmissionLimit) -> None:
+        """
+        This method is a default placeholder meant to be overwritten in a subclass. Though it can be left as is if you wish.
+
+        Called instead of running the components when the :obj:`AdmissionControl` doesn't admit them.
+        """
+        await self.edit_msg(
+            "Too many menus are open right now, try again later.", components=[]
+        )
+
+    async def error_callback(self, error: Exception) -> None:
+        """
+        This method is a default placeholder meant to be overwritten in a subclass. Though it can be left as is if you wish.
+
+        Only called for :obj:`Components` started with :meth:`start<Components.start>`, the
+        :obj:`ComponentsSupervisor` calls it with the exception that stopped the loop.
+        """
+        _LOGGER.error(
+            "%s stopped due to an unhandled exception",
+            type(self).__name__,
+            exc_info=(type(error), error, error.__traceback__),
+        )
 
     async def _process_event(self, event: hikari.InteractionCreateEvent) -> None:
         """Processes the given :obj:`hikari.InteractionCreateEvent`."""
@@ -584,7 +1303,7 @@ class Components(object):
 
         if event.interaction.component_type == hikari.ComponentType.BUTTON:
             x, y = [int(i) for i in event.interaction.custom_id.split(",")]
-            button = self.button_group.button_rows[y][x]
+            button = self.button_group.get_button(x, y)
             await self.button_callback(button, x, y, event.interaction)
 
         elif event.interaction.component_type == hikari.ComponentType.SELECT_MENU:
@@ -601,66 +1320,345 @@ class Components(object):
     async def run(self, resp: lightbulb.ResponseProxy) -> None:
         """
         Run a :obj:`Components` loop binded to the message of the given :obj:`lightbulb.ResponseProxy<lightbulb.context.base.ResponseProxy>`.
+        The references to :attr:`ctx` and :attr:`message` are released once it's done, even if a callback raised.
         """
+        try:
+            await self._run(resp)
+        finally:
+            self.release()
 
+    async def _run(self, resp: lightbulb.ResponseProxy) -> None:
         assert self.button_group or self.select_menu
-        # assert self.resp is not None
-        # The response is equal to None if there's a link button, not sure why.
-        # Everything still works with the response being equal to None, again not sure why.
 
-        self.message = await resp.message()
-        while True:
-            try:
-                event = await self.ctx.bot.wait_for(
-                    hikari.InteractionCreateEvent,
-                    timeout=self.timeout_length,
-                    predicate=lambda e: isinstance(
-                        e.interaction, hikari.ComponentInteraction
+        self.response = resp
+        # ResponseProxy.message() (lightbulb 2.x) returns the message it already holds without a request
+        # for prefix commands and followups, but fetches the initial response of an interaction through
+        # its token. That one is bound lazily from the first component interaction instead, unless the
+        # components may outlive the token, in which case it's fetched while the token is still valid.
+        time_left = _interaction_token_time_left(self.ctx)
+        is_initial_response = (
+            time_left is not None
+            and bool(self.ctx.responses)
+            and self.ctx.responses[0] is resp
+        )
+        if (
+            not is_initial_response
+            or self.timeout_length >= time_left - _INTERACTION_TOKEN_MARGIN
+        ):
+            self.message = await resp.message()
+
+        if (reason := await self.admission.admit(self)) is not None:
+            await self.rejected_callback(reason)
+            return
+
+        try:
+            await self._loop()
+        finally:
+            self.admission.leave(self)
+
+    async def _loop(self) -> None:
+        interaction = getattr(self.ctx, "interaction", None)
+        interaction_id = interaction.id if interaction is not None else None
+        # evict() resolves this future instead of cancelling the loop, so a cancellation
+        # coming from anywhere else is never mistaken for an eviction
+        self._eviction = asyncio.get_running_loop().create_future()
+        try:
+            while not self._is_evicted:
+                # The predicate only closes over the ids, so the event listener doesn't keep self alive
+                message_id = self.message.id if self.message is not None else None
+                waiter = asyncio.ensure_future(
+                    self.ctx.bot.wait_for(
+                        hikari.InteractionCreateEvent,
+                        timeout=self.timeout_length,
+                        predicate=lambda e: _is_for_message(e, message_id, interaction_id),
                     )
-                    and e.interaction.message.id == self.message.id,
                 )
-            except asyncio.TimeoutError:
-                await self.timeout_callback()
-                break
-            else:
-                await self._process_event(event)
-                if self._is_disabled:
+                try:
+                    await asyncio.wait(
+                        (waiter, self._eviction), return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    if not waiter.done():
+                        waiter.cancel()
+                if self._is_evicted:
                     break
 
+                try:
+                    event = waiter.result()
+                except asyncio.TimeoutError:
+                    await self.timeout_callback()
+                    return
+
+                self._last_interaction = time.monotonic()
+                self.admission._touch(self)
+                if self.message is None:
+                    # Component interactions come with the whole message, no need to fetch it
+                    self.message = event.interaction.message
+                await self._process_event(event)
+                if self._is_disabled and not self._is_evicted:
+                    return
+
+            # Evicted while waiting, during a callback or before the loop started
+            await self.timeout_callback()
+        finally:
+            self._eviction = None
+
+    def evict(self) -> None:
+        """
+        Stops the components early, as if they had timed out.
+        If a callback is running, :meth:`timeout_callback` runs once it's done instead.
+        """
+        if self._is_finished:
+            return
+        self._is_evicted = True
+        if self._eviction is not None and not self._eviction.done():
+            self._eviction.set_result(None)
+
+    def release(self) -> None:
+        """
+        Drops the references to :attr:`ctx` and :attr:`message`, so they can be garbage collected
+        even if this instance is still referenced somewhere.
+        It's called automatically once the :obj:`Components` loop is done.
+        """
+        self.deactivate_components()
+        self._is_finished = True
+        self.ctx = None
+        self.response = None
+        self.message = None
+
+    @classmethod
+    def live_instances(cls) -> t.List[Components]:
+        """Returns every instance of this class, or its subclasses, that hasn't been garbage collected."""
+        return [components for components in Components._live if isinstance(components, cls)]
+
+    @classmethod
+    def memory_report(
+        cls,
+        age_buckets: t.Sequence[float] = (60, 300, 900, 3600),
+        snapshot: bool = False,
+    ) -> ComponentsReport:
+        """
+        Reports how many instances of this class, or its subclasses, are alive, how old they are
+        and roughly how much memory they hold.
+
+        Args:
+            age_buckets (Sequence[:obj:`float`]): The upper bounds in seconds of the age histogram buckets.
+            snapshot (:obj:`bool`): Whether to take a :mod:`tracemalloc` snapshot, only if :mod:`tracemalloc` is tracing.
+
+        Returns:
+            :obj:`ComponentsReport`
+        """
+        instances = cls.live_instances()
+        now = time.monotonic()
+        bounds = sorted(age_buckets) + [float("inf")]
+        age_histogram = dict.fromkeys(bounds, 0)
+        retained_bytes = 0
+        finished = 0
+
+        for components in instances:
+            age = now - components._created_at
+            age_histogram[bounds[bisect.bisect_left(bounds, age)]] += 1
+            finished += components._is_finished
+            retained_bytes += components._approximate_size()
+
+        return ComponentsReport(
+            live=len(instances),
+            running=len(instances) - finished,
+            finished=finished,
+            age_histogram=age_histogram,
+            retained_bytes=retained_bytes,
+            snapshot=tracemalloc.take_snapshot()
+            if snapshot and tracemalloc.is_tracing()
+            else None,
+        )
+
+    def _approximate_size(self) -> int:
+        objects: t.List[t.Any] = [self, vars(self)]
+        if self.button_group:
+            objects.append(self.button_group)
+            objects.extend(button for row in self.button_group.button_rows for button in row)
+        if self.select_menu:
+            objects.append(self.select_menu)
+            objects.extend(self.select_menu.options)
+        size = 0
+        for obj in objects:
+            size += sys.getsizeof(obj)
+            if hasattr(obj, "__dict__") and obj is not self:
+                size += sys.getsizeof(vars(obj))
+        return size
+
+    def start(
+        self,
+        resp: lightbulb.ResponseProxy,
+        supervisor: t.Optional[ComponentsSupervisor] = None,
+    ) -> ComponentsHandle:
+        """
+        Start a :obj:`Components` loop in the background and return immediately.
+
+        Unlike :meth:`run<Components.run>`, the command does not have to stay open until the
+        components time out. The loop is handed to the bot's :obj:`ComponentsSupervisor`
+        (or the given one), which takes care of error reporting and cleanup.
+
+        Returns:
+            :obj:`ComponentsHandle`: A handle that can be awaited, cancelled or inspected.
+        """
+        supervisor = supervisor or ComponentsSupervisor.get(self.ctx.bot)
+        return supervisor.supervise(self, resp)
+
+    def snapshot(self) -> ComponentsSnapshot:
+        """
+        Returns a copy of the current state of the buttons and options.
+
+        Returns:
+            :obj:`ComponentsSnapshot`
+        """
+        snapshot = ComponentsSnapshot()
+        if self.button_group:
+            for index, button in enumerate(self.button_group._slots):
+                if button is not None:
+                    y, x = divmod(index, _ROW_LENGTH)
+                    snapshot.buttons[(x, y)] = button
+        if self.select_menu:
+            snapshot.options = list(self.select_menu.options)
+        return copy.deepcopy(snapshot)
+
+    @property
+    def locale(self) -> t.Optional[str]:
+        """The locale of the interaction that invoked the command, :obj:`None` for prefix commands."""
+        interaction = getattr(self.ctx, "interaction", None)
+        locale = getattr(interaction, "locale", None)
+        return str(locale) if locale is not None else None
+
+    def localize(self, value: t.Any) -> str:
+        """
+        Returns the text to show for the given label, description or placeholder.
+        :obj:`Localized` texts are translated with the :attr:`localizer` for the current :attr:`locale`.
+        """
+        if isinstance(value, Localized) and self.localizer is not None:
+            translated = self.localizer(value.key, self.locale)
+            if translated is not None:
+                return translated
+        return _render_text(value)
+
     def build(self) -> t.List[hikari.api.ActionRowBuilder]:
         """
         Builds the :obj:`Components` components.
         Will skip building :obj:`SelectMenu` if there's five rows of buttons already.
         This function also automatically updates the components indexes and coordinates.
 
+        If the same layout was already built for the same locale, it is taken from the :attr:`layout_cache`.
+        The returned action row builders may then be shared with other instances, so they must not be modified.
+        Components whose ``localizer`` isn't a plain function are only cached if a ``localizer_key`` was given.
+
         Returns:
             List[:obj:`hikari.api.ActionRowBuilder<hikari.api.special_endpoints.ActionRowBuilder>`]
         """
+        key = None
+        if (
+            self.layout_cache is not None
+            and (localizer := self._localizer_cache_key()) is not None
+        ):
+            key = (
+                type(self),
+                localizer,
+                self.locale,
+                self.button_group._layout_key() if self.button_group else None,
+                self.select_menu._layout_key() if self.select_menu else None,
+            )
+            try:
+                layout = self.layout_cache.get(key)
+            except TypeError:  # something in the layout isn't hashable
+                key = None
+            else:
+                if layout is not None:
+                    if self.button_group:
+                        self.button_group._update_layout()
+                    if self.select_menu:
+                        self.select_menu._update_layout()
+                    return layout
+
+        layout = self._build_layout()
+        if key is not None:
+            self.layout_cache.put(key, layout)
+        return layout
+
+    def _localizer_cache_key(self) -> t.Optional[t.Tuple[t.Any, ...]]:
+        # The layout cache is shared and long lived, so it must not keep the owner of a bound
+        # method or the variables of a closure alive, e.g. this instance and its context.
+        if self.localizer_key is not None:
+            return ("key", self.localizer_key)
+        if self.localizer is None:
+            return ("none",)
+        if (
+            isinstance(self.localizer, types.FunctionType)
+            and self.localizer.__closure__ is None
+        ):
+            return ("function", self.localizer)
+        warnings.warn(
+            f"{type(self).__name__} has a localizer that isn't a plain function and no localizer_key, "
+            "its components won't be cached",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return None
+
+    def _build_layout(self) -> t.List[hikari.api.ActionRowBuilder]:
         if (
             self.button_group
             and self.select_menu
-            and not self.button_group.button_rows[4]
+            and self.button_group.is_row_empty(4)
         ):
-            button_action_row = self.button_group._build(self.ctx)
-            select_menu_action_row = self.select_menu._build(self.ctx)
+            button_action_row = self.button_group._build(self.ctx, self.localize)
+            select_menu_action_row = self.select_menu._build(self.ctx, self.localize)
             button_action_row.extend(select_menu_action_row)
             return button_action_row
 
         elif self.button_group:
-            button_action_row = self.button_group._build(self.ctx)
+            button_action_row = self.button_group._build(self.ctx, self.localize)
             return button_action_row
 
         else:
-            select_menu_action_row = self.select_menu._build(self.ctx)
+            select_menu_action_row = self.select_menu._build(self.ctx, self.localize)
             return select_menu_action_row
 
-    async def edit_msg(self, *args: t.Any, **kwargs: t.Any) -> None:
+    async def edit_msg(
+        self,
+        *args: t.Any,
+        priority: EditPriority = EditPriority.INTERACTIVE,
+        **kwargs: t.Any,
+    ) -> None:
         """
-        Edits the message binded to this instance of :obj:`Components`.
+        Edits the message binded to this instance of :obj:`Components` through its :attr:`outbox`.
+        If the message isn't known yet, the response is edited through the interaction instead,
+        unless the interaction token is about to expire, then the message is fetched and edited by id.
 
-        Accepts any argument that can be passed to :meth:`hikari.messages.PartialMessage.edit`.
+        Accepts any argument that can be passed to :meth:`hikari.messages.PartialMessage.edit`,
+        along with the :obj:`EditPriority` of the edit.
         """
-        self.message = await self.message.edit(*args, **kwargs)
+        if self.message is None:
+            time_left = _interaction_token_time_left(self.ctx)
+            if time_left is not None and time_left < _INTERACTION_TOKEN_MARGIN:
+                await self.get_message()
+        target = self.message
+        if target is None:
+            target = _ResponseTarget(self.response, self.ctx)
+        self.message = await self.outbox.edit(
+            target, *args, priority=priority, **kwargs
+        )
+
+    async def get_message(self) -> hikari.Message:
+        """
+        Returns the message binded to this instance of :obj:`Components`.
+
+        For slash commands the message is only known once someone interacts with the components,
+        before that it has to be fetched.
+
+        Returns:
+            :obj:`hikari.Message<hikari.messages.Message>`
+        """
+        if self.message is None:
+            self.message = await self.response.message()
+        return self.message
 
     def disable_components(self) -> None:
         """Sets the components to be disabled and deactivated, you still have build the components to update them"""
@@ -673,3 +1671,487 @@ class Components(object):
     def deactivate_components(self) -> None:
         """If called, it deactivates the components as soon as a callback is done running."""
         self._is_disabled = True
+
+
+class ComponentsHandle(object):
+    """
+    A handle to a :obj:`Components` loop started with :meth:`Components.start`.
+
+    It can be awaited to wait for the loop to finish, cancelled, or inspected.
+    Instances are created by a :obj:`ComponentsSupervisor` and should not be created manually.
+
+    Args:
+        components (:obj:`Components`): The :obj:`Components` being run.
+        task (:obj:`asyncio.Task`): The task running the :obj:`Components` loop.
+    """
+
+    __slots__ = ("components", "task", "started_at")
+
+    def __init__(self, components: Components, task: asyncio.Task) -> None:
+        self.components = components
+        self.task = task
+        self.started_at: float = time.monotonic()
+
+    def __await__(self) -> t.Generator[t.Any, None, None]:
+        return asyncio.shield(self.task).__await__()
+
+    def __repr__(self) -> str:
+        state = "running" if not self.task.done() else "done"
+        return f"<ComponentsHandle {type(self.components).__name__} {state}>"
+
+    @property
+    def age(self) -> float:
+        """The amount of seconds since the :obj:`Components` loop was started."""
+        return time.monotonic() - self.started_at
+
+    def cancel(self) -> bool:
+        """
+        Deactivates the :obj:`Components` and cancels its loop.
+        Returns :obj:`False` if the loop was already done.
+        """
+        self.components.deactivate_components()
+        return self.task.cancel()
+
+    def done(self) -> bool:
+        """Whether the :obj:`Components` loop is done, either finished, failed or cancelled."""
+        return self.task.done()
+
+    def cancelled(self) -> bool:
+        """Whether the :obj:`Components` loop was cancelled."""
+        return self.task.cancelled()
+
+    def exception(self) -> t.Optional[BaseException]:
+        """
+        The exception that stopped the :obj:`Components` loop, or :obj:`None`.
+        Must only be called once the loop is done.
+        """
+        return self.task.exception()
+
+
+class ComponentsSupervisor(object):
+    """
+    Owns the lifecycle of :obj:`Components` loops started with :meth:`Components.start`.
+
+    One supervisor is shared per bot, it is retrieved with :meth:`get<ComponentsSupervisor.get>`.
+    Since the loops don't depend on the command that created them anymore, the amount of open
+    components is no longer tied to how many commands the bot is handling concurrently.
+
+    Args:
+        bot (:obj:`lightbulb.BotApp<lightbulb.app.BotApp>`): The bot the supervised components belong to.
+    """
+
+    def __init__(self, bot: lightbulb.BotApp) -> None:
+        self._bot = weakref.ref(bot)
+        self._handles: t.Set[ComponentsHandle] = set()
+        bot.subscribe(hikari.StoppingEvent, self._on_stopping)
+
+    @classmethod
+    def get(cls, bot: lightbulb.BotApp) -> ComponentsSupervisor:
+        """
+        Returns the :obj:`ComponentsSupervisor` of the given bot, creating it if it doesn't exist yet.
+        """
+        return _get_for_bot(cls, bot)
+
+    @property
+    def bot(self) -> t.Optional[lightbulb.BotApp]:
+        """The bot the supervised components belong to, :obj:`None` if it was garbage collected."""
+        return self._bot()
+
+    async def _on_stopping(self, event: hikari.StoppingEvent) -> None:
+        self.cancel_all()
+        await self.wait_all()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    @property
+    def handles(self) -> t.List[ComponentsHandle]:
+        """A list of the handles of the :obj:`Components` loops currently running."""
+        return list(self._handles)
+
+    def supervise(
+        self, components: Components, resp: lightbulb.ResponseProxy
+    ) -> ComponentsHandle:
+        """
+        Starts running the given :obj:`Components` in the background, binded to the message of
+        the given :obj:`lightbulb.ResponseProxy<lightbulb.context.base.ResponseProxy>`.
+
+        Returns:
+            :obj:`ComponentsHandle`
+        """
+        task = asyncio.get_running_loop().create_task(self._run(components, resp))
+        handle = ComponentsHandle(components, task)
+        self._handles.add(handle)
+        task.add_done_callback(lambda _: self._cleanup(handle))
+        return handle
+
+    def _cleanup(self, handle: ComponentsHandle) -> None:
+        self._handles.discard(handle)
+        if not handle.cancelled():
+            # The error was already reported by on_error, retrieving it here
+            # avoids asyncio complaining about it if the handle is never awaited.
+            handle.exception()
+
+    async def _run(
+        self, components: Components, resp: lightbulb.ResponseProxy
+    ) -> None:
+        try:
+            # Not run(), which would release the context and message before on_error can use them
+            await components._run(resp)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            await self.on_error(components, error)
+            raise
+        finally:
+            components.release()
+
+    async def on_error(self, components: Components, error: Exception) -> None:
+        """
+        Called when a supervised :obj:`Components` loop stops due to an exception.
+        By default it calls the components :meth:`error_callback<Components.error_callback>`.
+        """
+        try:
+            await components.error_callback(error)
+        except Exception:
+            _LOGGER.exception("error_callback of %s failed", type(components).__name__)
+
+    def cancel_all(self) -> None:
+        """
+        Cancels every :obj:`Components` loop currently running.
+        It's called automatically when the bot is stopping.
+        """
+        for handle in self.handles:
+            handle.cancel()
+
+    async def wait_all(self) -> None:
+        """Waits until every :obj:`Components` loop currently running is done."""
+        if self._handles:
+            await asyncio.gather(
+                *(handle.task for handle in self.handles), return_exceptions=True
+            )
+
+
+def _rate_limit_bucket(target: t.Union[hikari.PartialMessage, _ResponseTarget]) -> t.Hashable:
+    if isinstance(target, _ResponseTarget):
+        return target.rate_limit_bucket
+    return target.channel_id
+
+
+class _PendingEdit(object):
+    __slots__ = ("message", "kwargs", "priority", "seq", "futures")
+
+    def __init__(
+        self,
+        message: hikari.PartialMessage,
+        kwargs: t.Dict[str, t.Any],
+        priority: EditPriority,
+        seq: int,
+    ) -> None:
+        self.message = message
+        self.kwargs = kwargs
+        self.priority = priority
+        self.seq = seq
+        self.futures: t.List[asyncio.Future[hikari.Message]] = []
+
+
+class EditOutbox(object):
+    """
+    A queue every :obj:`Components` message edit goes through, shared per bot and retrieved with :meth:`get<EditOutbox.get>`.
+
+    Edits are sent by :obj:`EditPriority`, so a user waiting for a response doesn't wait behind a storm of timeout edits.
+    Only one edit per rate limit bucket is sent at a time: message edits share the bucket of their channel,
+    while edits of an interaction response that isn't bound to its message yet use the bucket of the interaction.
+    If a message is edited again before the previous edit was sent, both are merged into one request.
+
+    Args:
+        bot (:obj:`lightbulb.BotApp<lightbulb.app.BotApp>`): The bot the edits are sent by.
+        max_concurrency (:obj:`int`): The maximum amount of edits sent at the same time across every bucket.
+    """
+
+    def __init__(self, bot: lightbulb.BotApp, max_concurrency: int = 5) -> None:
+        self._bot = weakref.ref(bot)
+        self.max_concurrency = max_concurrency
+        self._queue: t.List[t.Tuple[int, int, hikari.Snowflake]] = []
+        self._pending: t.Dict[hikari.Snowflake, _PendingEdit] = {}
+        self._busy_buckets: t.Set[t.Hashable] = set()
+        self._tasks: t.Set[asyncio.Task[None]] = set()
+        self._counter = itertools.count()
+
+    @classmethod
+    def get(cls, bot: lightbulb.BotApp) -> EditOutbox:
+        """
+        Returns the :obj:`EditOutbox` of the given bot, creating it if it doesn't exist yet.
+        """
+        return _get_for_bot(cls, bot)
+
+    @property
+    def bot(self) -> t.Optional[lightbulb.BotApp]:
+        """The bot the edits are sent by, :obj:`None` if it was garbage collected."""
+        return self._bot()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def edit(
+        self,
+        message: hikari.PartialMessage,
+        *args: t.Any,
+        priority: EditPriority = EditPriority.INTERACTIVE,
+        **kwargs: t.Any,
+    ) -> hikari.Message:
+        """
+        Queues an edit of the given message and waits until it's sent.
+
+        Accepts any argument that can be passed to :meth:`hikari.messages.PartialMessage.edit`.
+        If the message already has an edit waiting, the arguments of this edit replace the ones they share with it
+        and the merged edit keeps the highest priority of both.
+
+        Returns:
+            :obj:`hikari.Message<hikari.messages.Message>`: The edited message.
+        """
+        # content is the only positional argument of an edit, keyword arguments are what gets merged
+        if args:
+            if len(args) > 1 or "content" in kwargs:
+                raise TypeError("edit() got multiple values for argument 'content'")
+            kwargs["content"] = args[0]
+
+        future: asyncio.Future[hikari.Message] = asyncio.get_running_loop().create_future()
+        pending = self._pending.get(message.id)
+        if pending is None:
+            pending = self._pending[message.id] = _PendingEdit(
+                message, kwargs, priority, next(self._counter)
+            )
+            heapq.heappush(self._queue, (priority, pending.seq, message.id))
+        else:
+            pending.message = message
+            pending.kwargs = {**pending.kwargs, **kwargs}
+            if priority < pending.priority:
+                pending.priority = priority
+                pending.seq = next(self._counter)
+                heapq.heappush(self._queue, (priority, pending.seq, message.id))
+        pending.futures.append(future)
+
+        self._dispatch()
+        return await future
+
+    def _dispatch(self) -> None:
+        deferred = []
+        while self._queue and len(self._busy_buckets) < self.max_concurrency:
+            priority, seq, message_id = heapq.heappop(self._queue)
+            pending = self._pending.get(message_id)
+            if pending is None or pending.seq != seq:
+                continue  # merged into an edit with a higher priority
+            bucket = _rate_limit_bucket(pending.message)
+            if bucket in self._busy_buckets:
+                deferred.append((priority, seq, message_id))
+                continue
+
+            del self._pending[message_id]
+            self._busy_buckets.add(bucket)
+            # The event loop only keeps weak references to tasks, keep them alive until they're done
+            task = asyncio.get_running_loop().create_task(self._send(pending, bucket))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        for item in deferred:
+            heapq.heappush(self._queue, item)
+
+    async def _send(self, pending: _PendingEdit, bucket: t.Hashable) -> None:
+        try:
+            message = await pending.message.edit(**pending.kwargs)
+        except Exception as error:
+            for future in pending.futures:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for future in pending.futures:
+                if not future.done():
+                    future.set_result(message)
+        finally:
+            self._busy_buckets.discard(bucket)
+            self._dispatch()
+
+
+class AdmissionLimit(enum.Enum):
+    """The limit an :obj:`AdmissionControl` reached."""
+
+    GLOBAL = "global"
+    """Too many components are running in the whole bot."""
+    GUILD = "guild"
+    """Too many components are running in the guild."""
+    LOOP_LAG = "loop_lag"
+    """The event loop is lagging behind."""
+
+
+class AdmissionControl(object):
+    """
+    Limits how many :obj:`Components` can run at the same time, shared per bot and retrieved with :meth:`get<AdmissionControl.get>`.
+
+    Every :obj:`Components` asks to be admitted before starting its loop. When a limit is reached,
+    :meth:`on_limit_reached<AdmissionControl.on_limit_reached>` decides whether to evict idle components to make room
+    or to reject the new ones, which then call their :meth:`rejected_callback<Components.rejected_callback>`.
+    There are no limits by default, set the attributes to enable them.
+
+    Args:
+        bot (:obj:`lightbulb.BotApp<lightbulb.app.BotApp>`): The bot the components belong to.
+        max_live (:obj:`int`): The maximum amount of components running in the whole bot.
+        max_live_per_guild (:obj:`int`): The maximum amount of components running in a single guild.
+        max_loop_lag (:obj:`float`): The maximum amount of seconds the event loop can lag behind before no more components are admitted.
+        evict_idle_after (:obj:`float`): How many seconds without interactions before components can be evicted to make room. Set this to :obj:`None` to never evict them.
+        lag_interval (:obj:`float`): How often, in seconds, the event loop lag is measured.
+    """
+
+    def __init__(
+        self,
+        bot: lightbulb.BotApp,
+        max_live: t.Optional[int] = None,
+        max_live_per_guild: t.Optional[int] = None,
+        max_loop_lag: t.Optional[float] = None,
+        evict_idle_after: t.Optional[float] = 30,
+        lag_interval: float = 0.5,
+    ) -> None:
+        self._bot = weakref.ref(bot)
+        self.max_live = max_live
+        self.max_live_per_guild = max_live_per_guild
+        self.max_loop_lag = max_loop_lag
+        self.evict_idle_after = evict_idle_after
+        self.lag_interval = lag_interval
+        self.loop_lag: float = 0.0
+        # Both are ordered by the last interaction of the components, the longest idle first,
+        # so finding the components to evict doesn't go through every running one.
+        self._running: collections.OrderedDict[Components, None] = collections.OrderedDict()
+        self._guilds: t.Dict[hikari.Snowflake, collections.OrderedDict[Components, None]] = {}
+        self._sampler: t.Optional[asyncio.Task[None]] = None
+
+    @classmethod
+    def get(cls, bot: lightbulb.BotApp) -> AdmissionControl:
+        """
+        Returns the :obj:`AdmissionControl` of the given bot, creating it if it doesn't exist yet.
+        """
+        return _get_for_bot(cls, bot)
+
+    @property
+    def bot(self) -> t.Optional[lightbulb.BotApp]:
+        """The bot the components belong to, :obj:`None` if it was garbage collected."""
+        return self._bot()
+
+    def __len__(self) -> int:
+        return len(self._running)
+
+    def guild_count(self, guild_id: hikari.Snowflakeish) -> int:
+        """The amount of components running in the given guild."""
+        return len(self._guilds.get(hikari.Snowflake(guild_id), ()))
+
+    def _limit_reached(
+        self, guild_id: t.Optional[hikari.Snowflake], check_lag: bool = True
+    ) -> t.Optional[AdmissionLimit]:
+        if (
+            check_lag
+            and self.max_loop_lag is not None
+            and self.loop_lag > self.max_loop_lag
+        ):
+            return AdmissionLimit.LOOP_LAG
+        if self.max_live is not None and len(self._running) >= self.max_live:
+            return AdmissionLimit.GLOBAL
+        if (
+            self.max_live_per_guild is not None
+            and guild_id is not None
+            and len(self._guilds.get(guild_id, ())) >= self.max_live_per_guild
+        ):
+            return AdmissionLimit.GUILD
+        return None
+
+    async def admit(self, components: Components) -> t.Optional[AdmissionLimit]:
+        """
+        Registers the given components as running if no limit is reached.
+
+        Returns:
+            Optional[:obj:`AdmissionLimit`]: The limit that was reached if the components were rejected, :obj:`None` if they were admitted.
+        """
+        guild_id = components.ctx.guild_id
+        check_lag = True
+        while (reason := self._limit_reached(guild_id, check_lag)) is not None:
+            if not await self.on_limit_reached(components, reason):
+                return reason
+            if reason is AdmissionLimit.LOOP_LAG:
+                # Evicting doesn't lower the measured lag right away, but the other limits still apply
+                check_lag = False
+
+        components._last_interaction = time.monotonic()
+        self._running[components] = None
+        if guild_id is not None:
+            self._guilds.setdefault(guild_id, collections.OrderedDict())[components] = None
+        if self.max_loop_lag is not None and self._sampler is None:
+            self._sampler = asyncio.get_running_loop().create_task(self._sample_lag())
+        return None
+
+    def leave(self, components: Components) -> None:
+        """Unregisters the given components once they stopped running."""
+        if components not in self._running:
+            return
+        del self._running[components]
+        if (guild_id := components.ctx.guild_id) is not None:
+            guild = self._guilds[guild_id]
+            del guild[components]
+            if not guild:
+                del self._guilds[guild_id]
+
+    def _touch(self, components: Components) -> None:
+        # Called on every interaction, moves the components to the end of the idle order
+        if components not in self._running:
+            return
+        self._running.move_to_end(components)
+        if (guild_id := components.ctx.guild_id) is not None:
+            self._guilds[guild_id].move_to_end(components)
+
+    def _iter_idle(
+        self, guild_id: t.Optional[hikari.Snowflake]
+    ) -> t.Iterator[Components]:
+        if self.evict_idle_after is None:
+            return
+        running = self._running if guild_id is None else self._guilds.get(guild_id, {})
+        idle_since = time.monotonic() - self.evict_idle_after
+        for components in running:
+            if components._last_interaction > idle_since:
+                return  # every following one interacted more recently
+            if not components._is_evicted:
+                yield components
+
+    def idle_components(
+        self, guild_id: t.Optional[hikari.Snowflake] = None
+    ) -> t.List[Components]:
+        """
+        Returns the running components that had no interactions for at least :attr:`evict_idle_after` seconds,
+        the longest idle first. If a guild id is given, only the components of that guild are returned.
+        """
+        return list(self._iter_idle(guild_id))
+
+    async def on_limit_reached(
+        self, components: Components, reason: AdmissionLimit
+    ) -> bool:
+        """
+        Called when a limit is reached while admitting the given components.
+        By default it evicts the longest idle components in the same scope to make room, and rejects the new ones if there are none.
+
+        Returns:
+            :obj:`bool`: Whether to try admitting the components again.
+        """
+        guild_id = components.ctx.guild_id if reason is AdmissionLimit.GUILD else None
+        idle = next(self._iter_idle(guild_id), None)
+        if idle is None:
+            return False
+        idle.evict()
+        self.leave(idle)
+        return True
+
+    async def _sample_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._running and self.max_loop_lag is not None:
+                start = loop.time()
+                await asyncio.sleep(self.lag_interval)
+                self.loop_lag = max(0.0, loop.time() - start - self.lag_interval)
+        finally:
+            self._sampler = None
+            self.loop_lag = 0.0
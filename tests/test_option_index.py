@@ -0,0 +1,45 @@
+import random
+import re
+
+from lightbulb.ext import tungsten
+
+_WORDS = ["red", "blue", "green", "reddish", "bluebird", "gre", "dark", "darker", "light"]
+
+
+def brute_force(options, query, limit=25):
+    query = query.casefold().strip()
+    words = re.findall(r"\w+", query)
+    if not words:
+        return [option.label for option in options[:limit]]
+
+    def matches(label):
+        tokens = re.findall(r"\w+", label.casefold())
+        return all(any(token.startswith(word) for token in tokens) for word in words)
+
+    whole = [option.label for option in options if option.label.casefold().startswith(query)]
+    rest = [option.label for option in options if option.label not in whole and matches(option.label)]
+    return (whole + rest)[:limit]
+
+
+def test_single_word_only_returns_matches():
+    options = [tungsten.Option(f"{i} {'red' if i % 2 == 0 else 'blue'}") for i in range(5000)]
+    index = tungsten.OptionIndex(options)
+
+    labels = [option.label for option in index.search("red")]
+
+    assert labels == brute_force(options, "red")
+    assert all(label.endswith("red") for label in labels)
+
+
+def test_search_matches_brute_force():
+    rng = random.Random(0)
+    for size in (10, 300, 5000):
+        options = [
+            tungsten.Option(f"{' '.join(rng.choices(_WORDS, k=rng.randint(1, 3)))} {i}")
+            for i in range(size)
+        ]
+        index = tungsten.OptionIndex(options)
+        for query in ["", "red", "re", "blue", "gre", "dark light", "red blue", "bluebird 1", "x", "1"]:
+            for limit in (1, 5, 25):
+                labels = [option.label for option in index.search(query, limit)]
+                assert labels == brute_force(options, query, limit), (size, query, limit)